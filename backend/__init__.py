@@ -10,6 +10,7 @@ Structure:
 - parsers/: Document parsing and text extraction
 - analyzers/: Analysis engines and scoring systems  
 - ai_services/: AI integration services (Gemini, Groq)
+- json_output.py: Shared indented JSON output for the CLIs
 """
 
 __version__ = "1.0.0"
@@ -4,12 +4,15 @@ Provides intelligent analysis and formatting of extracted resume data
 """
 
 import json
+import logging
 import os
 import sys
 import re
 from typing import Dict, Any, Optional, List
 import requests
 
+logger = logging.getLogger(__name__)
+
 
 class GeminiAnalyzer:
     """Integrates with Google Gemini AI for advanced resume analysis"""
@@ -66,7 +69,7 @@ class GeminiAnalyzer:
                 return self._fallback_analysis(extracted_data, job_title, job_description, skills_analysis)
                 
         except Exception as e:
-            print(f"Gemini API error: {e}")
+            logger.warning("Gemini API error: %s", e)
             return self._fallback_analysis(extracted_data, job_title, job_description, skills_analysis)
     
     def _create_analysis_prompt(self, extracted_data: Dict[str, Any], original_text: str, job_title: str = None, job_description: str = None, skills_analysis: Dict[str, Any] = None) -> str:
@@ -855,10 +858,10 @@ Please provide a detailed analysis in the following JSON format:
                 if 'candidates' in result and len(result['candidates']) > 0:
                     return result['candidates'][0]['content']['parts'][0]['text']
             else:
-                print(f"Gemini API error: {response.status_code} - {response.text}")
+                logger.warning("Gemini API error: %s - %s", response.status_code, response.text)
                 
         except Exception as e:
-            print(f"Error calling Gemini API: {e}")
+            logger.warning("Error calling Gemini API: %s", e)
         
         return None
     
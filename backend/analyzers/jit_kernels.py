@@ -0,0 +1,28 @@
+"""
+numba-compiled kernels behind numeric_kernels
+
+Imported only by the numeric_kernels wrappers, on the first batch call, so
+numpy and numba stay out of the import path of the analyzers. The kernels
+take no explicit signatures: numba compiles each one on its first call (or
+loads it from its on-disk cache) rather than at import, so cold workers that
+never batch do not pay for compilation.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def flesch_batch(words, sentences, syllables):
+    """Flesch Reading Ease and Flesch-Kincaid Grade for arrays of counts"""
+    count = words.shape[0]
+    reading_ease = np.zeros(count)
+    grade_level = np.zeros(count)
+    for i in range(count):
+        if sentences[i] == 0 or words[i] == 0:
+            continue
+        words_per_sentence = words[i] / sentences[i]
+        syllables_per_word = syllables[i] / words[i]
+        reading_ease[i] = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        grade_level[i] = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    return reading_ease, grade_level
@@ -0,0 +1,36 @@
+"""
+Optional numba-compiled kernels for batch numeric scoring
+
+Kept in a plain Python module so numba always sees ordinary Python
+functions, even when the analyzers that call these kernels are compiled
+ahead of time (e.g. with mypyc). NUMBA_AVAILABLE is False when numba or
+numpy is not installed; callers then use their scalar code paths.
+
+numpy, numba and the kernels in jit_kernels are imported by the wrappers
+on first use, so importing this module stays cheap.
+"""
+
+import importlib.util
+from typing import List, Tuple
+
+# Probed without importing either package
+NUMBA_AVAILABLE = (importlib.util.find_spec("numba") is not None
+                   and importlib.util.find_spec("numpy") is not None)
+
+
+def flesch_scores_batch(word_counts: List[int],
+                        sentence_counts: List[int]) -> Tuple[List[float], List[float]]:
+    """
+    Flesch Reading Ease and Flesch-Kincaid Grade for many documents
+    
+    Requires NUMBA_AVAILABLE. Documents with no words or sentences score 0.
+    """
+    import numpy as np
+    from .jit_kernels import flesch_batch
+    
+    words = np.array(word_counts, dtype=np.int64)
+    sentences = np.array(sentence_counts, dtype=np.int64)
+    syllables = words * 1.5  # Rough estimate, as in FeedbackReportGenerator
+    
+    reading_ease, grade_level = flesch_batch(words, sentences, syllables)
+    return reading_ease.tolist(), grade_level.tolist()
@@ -4,14 +4,16 @@ Feedback Report Generator - Creates structured JSON responses for resume analysi
 
 import json
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from datetime import datetime
+from . import numeric_kernels
+from ..json_output import dump_json
 
 
 class FeedbackReportGenerator:
     """Generates structured feedback reports from parsed resume data"""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.role_mapping = {
             "software": "Software Developer",
             "data": "Data Scientist",
@@ -35,15 +37,37 @@ class FeedbackReportGenerator:
             "ux": "UX Designer",
             "ui": "UI Designer"
         }
+        
+        # Achievement vs responsibility phrasing, matched case-insensitively in one scan each
+        self.achievement_indicator_pattern = re.compile(
+            r'achieved|improved|increased|reduced|delivered|exceeded', re.IGNORECASE
+        )
+        self.responsibility_indicator_pattern = re.compile(
+            r'responsible for|duties include|tasks involve', re.IGNORECASE
+        )
+        
+        # Terms indicating technical depth, matched against lowercased text
+        self.technical_terms = (
+            "architecture", "framework", "algorithm", "optimization", "scalability",
+            "performance", "integration", "deployment", "infrastructure", "security"
+        )
+        # Technical depth level indexed by number of terms found, capped at 5
+        self.technical_depth_levels = ("minimal", "basic", "basic", "moderate", "moderate", "high")
+        
+        # Runs of sentence terminators, e.g. "." or "?!" or "..."
+        self.sentence_end_pattern = re.compile(r'[.!?]+')
     
-    def generate_feedback_report(self, parse_result: Dict[str, Any], 
-                               job_description: str = None,
-                               required_skills: List[str] = None) -> Dict[str, Any]:
+    def generate_feedback_report(self, parse_result: Mapping[str, Any], 
+                               job_description: Optional[str] = None,
+                               required_skills: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Generate a structured feedback report from parsed resume data
         
         Args:
-            parse_result: Complete parsing result from document_parser
+            parse_result: Complete parsing result from document_parser; read
+                only, and may be passed as a read-only view. Nested data is
+                referenced in the report rather than copied, so it must not
+                be mutated here.
             job_description: Optional job description for context
             required_skills: Optional list of required skills
             
@@ -57,6 +81,9 @@ class FeedbackReportGenerator:
         quality_analysis = parse_result.get("quality_analysis", {})
         ats_analysis = parse_result.get("ats_analysis", {})
         
+        # Word and sentence counts shared by the content and readability sections
+        text_stats = self._compute_text_stats(parse_result.get("text_extraction", {}).get("text", ""))
+        
         # Build structured report
         report = {
             "status": "success" if parse_result.get("success") else "error",
@@ -84,9 +111,9 @@ class FeedbackReportGenerator:
             "quality_breakdown": self._extract_detailed_quality_breakdown(quality_analysis),
             "ats_detailed_analysis": self._extract_detailed_ats_analysis(ats_analysis),
             "skills_detailed_analysis": self._extract_detailed_skills_analysis(info_extraction, ai_analysis),
-            "content_analysis": self._extract_content_analysis(parse_result),
+            "content_analysis": self._extract_content_analysis(parse_result, text_stats),
             "formatting_analysis": self._extract_formatting_analysis(parse_result),
-            "readability_metrics": self._extract_readability_metrics(parse_result),
+            "readability_metrics": self._extract_readability_metrics(parse_result, text_stats),
             "industry_analysis": self._extract_industry_analysis(info_extraction),
             "career_progression": self._extract_career_progression(info_extraction),
             "education_analysis": self._extract_education_analysis(info_extraction),
@@ -105,6 +132,37 @@ class FeedbackReportGenerator:
         
         return report
     
+    def score_readability_batch(self, parse_results: List[Mapping[str, Any]]) -> List[Dict[str, float]]:
+        """
+        Flesch readability scores for many parsed resumes at once
+        
+        Uses a numba-compiled kernel over all documents when numba is
+        installed, otherwise scores each document individually.
+        
+        Args:
+            parse_results: Parsing results from document_parser
+            
+        Returns:
+            One {"flesch_reading_ease", "flesch_kincaid_grade"} dict per resume
+        """
+        all_stats = [self._compute_text_stats(parse_result.get("text_extraction", {}).get("text", ""))
+                     for parse_result in parse_results]
+        
+        if not numeric_kernels.NUMBA_AVAILABLE or not all_stats:
+            return [{
+                "flesch_reading_ease": self._calculate_flesch_score(stats),
+                "flesch_kincaid_grade": self._calculate_flesch_kincaid_grade(stats)
+            } for stats in all_stats]
+        
+        reading_ease, grade_level = numeric_kernels.flesch_scores_batch(
+            [stats["word_count"] for stats in all_stats],
+            [stats["sentence_count"] for stats in all_stats]
+        )
+        return [{
+            "flesch_reading_ease": ease,
+            "flesch_kincaid_grade": grade
+        } for ease, grade in zip(reading_ease, grade_level)]
+    
     def _extract_contact_info(self, info_extraction: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and structure contact information"""
         contact = info_extraction.get("contact_info", {})
@@ -250,7 +308,7 @@ class FeedbackReportGenerator:
     
     def _extract_skills_analysis(self, info_extraction: Dict[str, Any], 
                                 ai_analysis: Dict[str, Any],
-                                required_skills: List[str] = None) -> Dict[str, Any]:
+                                required_skills: Optional[List[str]] = None) -> Dict[str, Any]:
         """Extract and analyze skills with job matching"""
         skills_data = info_extraction.get("skills", {})
         all_skills = skills_data.get("all_skills", [])
@@ -467,7 +525,7 @@ class FeedbackReportGenerator:
             "employment_gaps": self._detect_employment_gaps(experience_data.get("experience_list", []))
         }
     
-    def _extract_recommendations(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_recommendations(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract and categorize recommendations"""
         all_recommendations = parse_result.get("recommendations", [])
         quality_recs = parse_result.get("quality_analysis", {}).get("recommendations", {})
@@ -487,7 +545,7 @@ class FeedbackReportGenerator:
             "top_3": self._get_top_recommendations(categorized)
         }
     
-    def _extract_document_metrics(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_document_metrics(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract document-level metrics"""
         summary = parse_result.get("summary", {})
         file_info = parse_result.get("file_info", {})
@@ -692,10 +750,10 @@ class FeedbackReportGenerator:
                 if current_end and next_start and current_end.lower() not in ["present", "current"]:
                     # Simple year-based gap detection
                     try:
-                        current_year = int(re.search(r'\b(19|20)\d{2}\b', current_end).group())
-                        next_year = int(re.search(r'\b(19|20)\d{2}\b', next_start).group())
+                        current_match = re.search(r'\b(19|20)\d{2}\b', current_end)
+                        next_match = re.search(r'\b(19|20)\d{2}\b', next_start)
                         
-                        if next_year - current_year > 1:
+                        if current_match and next_match and int(next_match.group()) - int(current_match.group()) > 1:
                             gaps.append(f"Gap between {current_end} and {next_start}")
                     except:
                         pass  # Skip if can't parse dates
@@ -704,7 +762,7 @@ class FeedbackReportGenerator:
     
     def _get_top_recommendations(self, categorized_recs: Dict[str, List[str]]) -> List[str]:
         """Get top 3 recommendations across all categories"""
-        top_recs = []
+        top_recs: List[str] = []
         
         # Priority order: critical, high_priority, ats_improvements, medium_priority
         for category in ["critical", "high_priority", "ats_improvements", "medium_priority"]:
@@ -725,7 +783,7 @@ class FeedbackReportGenerator:
         
         return top_recs
     
-    def _extract_error_details(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_error_details(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract detailed error information"""
         errors = {}
         
@@ -741,7 +799,7 @@ class FeedbackReportGenerator:
         return errors
 
 
-    def _extract_text_extraction_details(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_text_extraction_details(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract detailed text extraction information"""
         text_extraction = parse_result.get("text_extraction", {})
         
@@ -758,7 +816,7 @@ class FeedbackReportGenerator:
             "extraction_warnings": text_extraction.get("warnings", [])
         }
 
-    def _extract_section_analysis(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_section_analysis(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract section detection analysis"""
         section_detection = parse_result.get("section_detection", {})
         text_normalization = parse_result.get("text_normalization", {})
@@ -872,27 +930,27 @@ class FeedbackReportGenerator:
             "skill_combinations": self._analyze_skill_combinations(skills_data)
         }
 
-    def _extract_content_analysis(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_content_analysis(self, parse_result: Mapping[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
         """Extract content quality analysis"""
         text_extraction = parse_result.get("text_extraction", {})
         text = text_extraction.get("text", "")
         
         return {
-            "word_count": len(text.split()),
+            "word_count": stats["word_count"],
             "character_count": len(text),
-            "sentence_count": len([s for s in text.split('.') if s.strip()]),
+            "sentence_count": stats["sentence_count"],
             "paragraph_count": len([p for p in text.split('\n\n') if p.strip()]),
-            "average_sentence_length": self._calculate_average_sentence_length(text),
-            "vocabulary_richness": self._calculate_vocabulary_richness(text),
-            "action_verb_density": self._calculate_action_verb_density(text),
+            "average_sentence_length": self._calculate_average_sentence_length(stats["sentences"]),
+            "vocabulary_richness": self._calculate_vocabulary_richness(stats["lower_words"]),
+            "action_verb_density": self._calculate_action_verb_density(stats["lower_words"]),
             "quantification_rate": self._calculate_quantification_rate(text),
-            "passive_voice_usage": self._calculate_passive_voice_usage(text),
-            "content_depth": self._analyze_content_depth(text),
+            "passive_voice_usage": self._calculate_passive_voice_usage(stats["sentences"]),
+            "content_depth": self._analyze_content_depth(stats),
             "technical_depth": self._analyze_technical_depth(text),
             "achievement_focus": self._analyze_achievement_focus(text)
         }
 
-    def _extract_formatting_analysis(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_formatting_analysis(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract document formatting analysis"""
         text_extraction = parse_result.get("text_extraction", {})
         
@@ -907,20 +965,20 @@ class FeedbackReportGenerator:
             "professional_appearance": self._assess_professional_appearance(parse_result)
         }
 
-    def _extract_readability_metrics(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_readability_metrics(self, parse_result: Mapping[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
         """Extract readability analysis"""
         text_extraction = parse_result.get("text_extraction", {})
         text = text_extraction.get("text", "")
         
         return {
-            "flesch_reading_ease": self._calculate_flesch_score(text),
-            "flesch_kincaid_grade": self._calculate_flesch_kincaid_grade(text),
+            "flesch_reading_ease": self._calculate_flesch_score(stats),
+            "flesch_kincaid_grade": self._calculate_flesch_kincaid_grade(stats),
             "automated_readability_index": self._calculate_ari(text),
             "gunning_fog_index": self._calculate_gunning_fog(text),
             "clarity_score": self._calculate_clarity_score(text),
             "conciseness_score": self._calculate_conciseness_score(text),
             "professional_tone": self._analyze_professional_tone(text),
-            "reading_time_estimate": self._estimate_reading_time(text)
+            "reading_time_estimate": self._estimate_reading_time(stats)
         }
 
     def _extract_industry_analysis(self, info_extraction: Dict[str, Any]) -> Dict[str, Any]:
@@ -1022,7 +1080,7 @@ class FeedbackReportGenerator:
             "technical_gaps": self._identify_technical_gaps(info_extraction)
         }
 
-    def _extract_optimization_suggestions(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_optimization_suggestions(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract comprehensive optimization suggestions"""
         quality_analysis = parse_result.get("quality_analysis", {})
         ats_analysis = parse_result.get("ats_analysis", {})
@@ -1052,7 +1110,7 @@ class FeedbackReportGenerator:
             "unique_value_proposition": self._identify_unique_value_proposition(info_extraction)
         }
 
-    def _extract_parsing_metadata(self, parse_result: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_parsing_metadata(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         """Extract parsing metadata and statistics"""
         return {
             "parsing_timestamp": datetime.now().isoformat(),
@@ -1090,12 +1148,27 @@ class FeedbackReportGenerator:
         }
 
     # Helper methods for the new analysis functions
+    def _compute_text_stats(self, text: str) -> Dict[str, Any]:
+        """Lowercased words, sentences and their counts, computed once per report"""
+        lower_words = text.lower().split()
+        
+        # Non-empty fragments between runs of '.', '!' or '?'; every sentence
+        # figure in the report (counts, averages, passive rate) uses these
+        sentences = [s.strip() for s in self.sentence_end_pattern.split(text) if s.strip()]
+        
+        return {
+            "lower_words": lower_words,
+            "sentences": sentences,
+            "word_count": len(lower_words),
+            "sentence_count": len(sentences)
+        }
+
     def _analyze_skill_levels(self, skills_data: Dict) -> Dict[str, str]:
         """Analyze skill proficiency levels"""
         # Implementation would analyze context clues to determine skill levels
         return {"placeholder": "skill_level_analysis"}
 
-    def _analyze_skill_relevance(self, skills_data: Dict) -> Dict[str, float]:
+    def _analyze_skill_relevance(self, skills_data: Dict) -> Dict[str, Any]:
         """Analyze relevance of skills to current market"""
         return {"placeholder": "skill_relevance_analysis"}
 
@@ -1119,29 +1192,26 @@ class FeedbackReportGenerator:
         """Analyze skill combinations and synergies"""
         return {"placeholder": "skill_combinations_analysis"}
 
-    def _calculate_average_sentence_length(self, text: str) -> float:
+    def _calculate_average_sentence_length(self, sentences: List[str]) -> float:
         """Calculate average sentence length"""
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
         if not sentences:
             return 0
         total_words = sum(len(s.split()) for s in sentences)
         return total_words / len(sentences)
 
-    def _calculate_vocabulary_richness(self, text: str) -> float:
+    def _calculate_vocabulary_richness(self, words: List[str]) -> float:
         """Calculate vocabulary richness (unique words / total words)"""
-        words = text.lower().split()
         if not words:
             return 0
         unique_words = set(words)
         return len(unique_words) / len(words)
 
-    def _calculate_action_verb_density(self, text: str) -> float:
+    def _calculate_action_verb_density(self, words: List[str]) -> float:
         """Calculate action verb density"""
         action_verbs = [
             "achieved", "developed", "implemented", "led", "managed", "created", 
             "designed", "built", "optimized", "improved", "increased", "reduced"
         ]
-        words = text.lower().split()
         action_verb_count = sum(1 for word in words if word in action_verbs)
         return action_verb_count / len(words) if words else 0
 
@@ -1161,11 +1231,10 @@ class FeedbackReportGenerator:
         
         return quantified_count / len(bullet_points)
 
-    def _calculate_passive_voice_usage(self, text: str) -> float:
+    def _calculate_passive_voice_usage(self, sentences: List[str]) -> float:
         """Calculate passive voice usage rate"""
         import re
         passive_indicators = [r'was\s+\w+ed', r'were\s+\w+ed', r'been\s+\w+ed', r'being\s+\w+ed']
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
         
         if not sentences:
             return 0
@@ -1177,9 +1246,9 @@ class FeedbackReportGenerator:
         
         return passive_count / len(sentences)
 
-    def _analyze_content_depth(self, text: str) -> str:
+    def _analyze_content_depth(self, stats: Dict[str, Any]) -> str:
         """Analyze the depth and detail of content"""
-        word_count = len(text.split())
+        word_count = stats["word_count"]
         if word_count > 400:
             return "comprehensive"
         elif word_count > 250:
@@ -1191,30 +1260,20 @@ class FeedbackReportGenerator:
 
     def _analyze_technical_depth(self, text: str) -> str:
         """Analyze technical depth of content"""
-        technical_terms = [
-            "architecture", "framework", "algorithm", "optimization", "scalability",
-            "performance", "integration", "deployment", "infrastructure", "security"
-        ]
         text_lower = text.lower()
-        technical_count = sum(1 for term in technical_terms if term in text_lower)
+        technical_count = sum(1 for term in self.technical_terms if term in text_lower)
         
-        if technical_count >= 5:
-            return "high"
-        elif technical_count >= 3:
-            return "moderate"
-        elif technical_count >= 1:
-            return "basic"
-        else:
-            return "minimal"
+        return self.technical_depth_levels[min(technical_count, 5)]
 
     def _analyze_achievement_focus(self, text: str) -> str:
         """Analyze focus on achievements vs responsibilities"""
-        achievement_indicators = ["achieved", "improved", "increased", "reduced", "delivered", "exceeded"]
-        responsibility_indicators = ["responsible for", "duties include", "tasks involve"]
-        
-        text_lower = text.lower()
-        achievement_count = sum(1 for indicator in achievement_indicators if indicator in text_lower)
-        responsibility_count = sum(1 for indicator in responsibility_indicators if indicator in text_lower)
+        # Count distinct indicators present, not total occurrences
+        achievement_count = len({
+            match.group().lower() for match in self.achievement_indicator_pattern.finditer(text)
+        })
+        responsibility_count = len({
+            match.group().lower() for match in self.responsibility_indicator_pattern.finditer(text)
+        })
         
         if achievement_count > responsibility_count * 2:
             return "achievement-focused"
@@ -1224,35 +1283,35 @@ class FeedbackReportGenerator:
             return "responsibility-focused"
 
     # Placeholder implementations for complex analysis methods
-    def _analyze_document_structure(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_document_structure(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"structure_quality": "professional", "sections_order": "standard"}
 
-    def _analyze_formatting_consistency(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_formatting_consistency(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"consistency_score": 85, "inconsistencies": []}
 
-    def _analyze_visual_hierarchy(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_visual_hierarchy(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"hierarchy_clarity": "good", "heading_levels": 3}
 
-    def _analyze_white_space_usage(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_white_space_usage(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"white_space_optimization": "adequate", "density_score": 75}
 
-    def _analyze_font_usage(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_font_usage(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"font_consistency": "good", "professional_fonts": True}
 
-    def _analyze_bullet_point_usage(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_bullet_point_usage(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"bullet_consistency": "good", "bullet_count": 12}
 
-    def _analyze_section_transitions(self, parse_result: Dict) -> Dict[str, Any]:
+    def _analyze_section_transitions(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"transition_quality": "smooth", "section_breaks": "appropriate"}
 
-    def _assess_professional_appearance(self, parse_result: Dict) -> Dict[str, Any]:
+    def _assess_professional_appearance(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"professional_score": 85, "appearance_issues": []}
 
-    def _calculate_flesch_score(self, text: str) -> float:
+    def _calculate_flesch_score(self, stats: Dict[str, Any]) -> float:
         """Calculate Flesch Reading Ease score"""
         # Simplified implementation
-        words = len(text.split())
-        sentences = len([s for s in text.split('.') if s.strip()])
+        words = stats["word_count"]
+        sentences = stats["sentence_count"]
         syllables = words * 1.5  # Rough estimate
         
         if sentences == 0 or words == 0:
@@ -1260,10 +1319,10 @@ class FeedbackReportGenerator:
         
         return 206.835 - (1.015 * (words / sentences)) - (84.6 * (syllables / words))
 
-    def _calculate_flesch_kincaid_grade(self, text: str) -> float:
+    def _calculate_flesch_kincaid_grade(self, stats: Dict[str, Any]) -> float:
         """Calculate Flesch-Kincaid Grade Level"""
-        words = len(text.split())
-        sentences = len([s for s in text.split('.') if s.strip()])
+        words = stats["word_count"]
+        sentences = stats["sentence_count"]
         syllables = words * 1.5  # Rough estimate
         
         if sentences == 0 or words == 0:
@@ -1291,9 +1350,9 @@ class FeedbackReportGenerator:
         """Analyze professional tone"""
         return "professional"  # Placeholder
 
-    def _estimate_reading_time(self, text: str) -> str:
+    def _estimate_reading_time(self, stats: Dict[str, Any]) -> str:
         """Estimate reading time"""
-        words = len(text.split())
+        words = stats["word_count"]
         minutes = max(1, words // 200)  # 200 words per minute
         return f"{minutes} minute{'s' if minutes != 1 else ''}"
 
@@ -1433,16 +1492,16 @@ class FeedbackReportGenerator:
     def _identify_technical_gaps(self, info_extraction: Dict) -> List[str]:
         return ["modern frameworks", "cloud platforms"]
 
-    def _generate_content_optimization_suggestions(self, parse_result: Dict) -> List[str]:
+    def _generate_content_optimization_suggestions(self, parse_result: Mapping[str, Any]) -> List[str]:
         return ["Add more quantified achievements", "Include specific technologies used"]
 
-    def _generate_formatting_optimization_suggestions(self, parse_result: Dict) -> List[str]:
+    def _generate_formatting_optimization_suggestions(self, parse_result: Mapping[str, Any]) -> List[str]:
         return ["Improve bullet point consistency", "Enhance section headers"]
 
-    def _generate_keyword_optimization_suggestions(self, parse_result: Dict) -> List[str]:
+    def _generate_keyword_optimization_suggestions(self, parse_result: Mapping[str, Any]) -> List[str]:
         return ["Include industry-specific keywords", "Add trending technology terms"]
 
-    def _generate_structure_optimization_suggestions(self, parse_result: Dict) -> List[str]:
+    def _generate_structure_optimization_suggestions(self, parse_result: Mapping[str, Any]) -> List[str]:
         return ["Reorganize sections for better flow", "Add summary section"]
 
     def _generate_ats_optimization_suggestions(self, ats_analysis: Dict) -> List[str]:
@@ -1451,10 +1510,10 @@ class FeedbackReportGenerator:
     def _generate_quality_optimization_suggestions(self, quality_analysis: Dict) -> List[str]:
         return ["Strengthen action verbs", "Add more metrics", "Improve clarity"]
 
-    def _generate_industry_optimization_suggestions(self, parse_result: Dict) -> List[str]:
+    def _generate_industry_optimization_suggestions(self, parse_result: Mapping[str, Any]) -> List[str]:
         return ["Include industry certifications", "Add relevant project experience"]
 
-    def _generate_role_specific_optimization(self, parse_result: Dict) -> List[str]:
+    def _generate_role_specific_optimization(self, parse_result: Mapping[str, Any]) -> List[str]:
         return ["Highlight leadership experience", "Emphasize technical skills"]
 
     def _assess_market_positioning(self, info_extraction: Dict) -> Dict[str, Any]:
@@ -1481,13 +1540,13 @@ class FeedbackReportGenerator:
     def _identify_unique_value_proposition(self, info_extraction: Dict) -> List[str]:
         return ["full-stack expertise", "leadership potential"]
 
-    def _calculate_overall_parsing_confidence(self, parse_result: Dict) -> float:
+    def _calculate_overall_parsing_confidence(self, parse_result: Mapping[str, Any]) -> float:
         return 85.0
 
-    def _calculate_info_extraction_confidence(self, parse_result: Dict) -> float:
+    def _calculate_info_extraction_confidence(self, parse_result: Mapping[str, Any]) -> float:
         return 80.0
 
-    def _assess_data_completeness(self, parse_result: Dict) -> Dict[str, Any]:
+    def _assess_data_completeness(self, parse_result: Mapping[str, Any]) -> Dict[str, Any]:
         return {"completeness_score": 90, "missing_sections": []}
 
 
@@ -1531,7 +1590,7 @@ def main():
         required_skills=required_skills
     )
     
-    print(json.dumps(report, indent=2, ensure_ascii=False))
+    print(dump_json(report))
 
 
 if __name__ == "__main__":
@@ -4,9 +4,40 @@ Provides detailed scoring with actionable recommendations for improvement
 """
 
 import re
-import statistics
-from typing import Dict, Any, List, Tuple
-from collections import Counter
+import json
+import hashlib
+import importlib.util
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, FrozenSet
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional vectorized character counting; probed here, imported on first use
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+
+# Skill categories merged into the resume side of the skills coverage check
+SKILL_CATEGORIES = (
+    "programming_languages", "web_technologies", "databases", "cloud_platforms",
+    "tools_frameworks", "soft_skills", "matched_skills"
+)
+
+
+@lru_cache(maxsize=16)
+def _normalize_target_skills(target_skills: Tuple[str, ...]) -> FrozenSet[str]:
+    """Lowercased, stripped target skills, cached across resumes scored for the same role"""
+    return frozenset(skill.lower().strip() for skill in target_skills if skill)
+
+
+@dataclass(frozen=True, slots=True)
+class _TextViews:
+    """Views of one resume text, derived once per scoring call and shared by the pillars"""
+    raw: str
+    lines: Tuple[str, ...]
+    lower_lines: Tuple[str, ...]
+    sentences: Tuple[str, ...]
+    bullets: Tuple[str, ...]
 
 
 class ResumeQualityScorer:
@@ -63,6 +94,70 @@ class ResumeQualityScorer:
             'skills': ['skills', 'technical', 'technologies', 'tools', 'competencies'],
             'contact': ['contact', 'phone', 'email', 'address', 'linkedin']
         }
+        
+        # Only used to test whether a sentence is passive, so each pattern stops as
+        # soon as a match is certain (no trailing \w* after "by [A-Z]")
+        self.passive_patterns = [
+            r'\b(?:was|were|is|are)\s+\w+(?:ed|en)\b',  # was/were + past participle (-ed or -en)
+            r'\b(?:been|being)\s+\w+ed\b',  # been/being + past participle
+            r'\bby\s+(?:the\s+)?[A-Z]',  # "by [Company/Person]" pattern
+        ]
+        
+        # Characters counted by _basic_ats_analysis (str.count / findall, or numpy when installed)
+        self.problematic_symbols = ('★', '☆', '●', '◆', '▲', '▼', '♦', '♠', '♥', '♣', '✓', '✗', '→', '←')
+        self.complex_formatting_patterns = [
+            re.compile(r'[│┌┐└┘├┤┬┴┼]'),  # Box drawing characters
+            re.compile(r'[═║╔╗╚╝╠╣╦╩╬]'),  # Double box drawing
+            re.compile(r'[▓▒░]'),  # Block characters
+        ]
+        self.complex_formatting_chars = '│┌┐└┘├┤┬┴┼═║╔╗╚╝╠╣╦╩╬▓▒░'
+        # numpy arrays of the code points above, see _special_codepoint_arrays
+        self._special_codepoints = None
+        
+        # Keyword tuples for str.startswith header checks in _analyze_key_sections
+        self.section_keyword_prefixes = {
+            section_name: tuple(keywords) for section_name, keywords in self.required_sections.items()
+        }
+        
+        # Compiled once per scorer; the hot loops below run them per line/sentence.
+        # Each pattern list is fused into a single alternation so one scan covers all of them.
+        # Kept on stdlib re: the third-party `regex` engine folds case and places \b
+        # differently for some Unicode text (e.g. 'İ' vs [A-Z], '²' before a digit),
+        # which would make scores depend on an optional package.
+        self.metric_union_pattern = re.compile(
+            '|'.join(f'(?:{p})' for p in self.metric_patterns), re.IGNORECASE
+        )
+        self.passive_union_pattern = re.compile(
+            '|'.join(f'(?:{p})' for p in self.passive_patterns), re.IGNORECASE
+        )
+        
+        # Action verb classifiers: anchored prefix matches for strong/moderate verbs
+        # (alternatives are tried in list order, like the original startswith loop)
+        # and a substring search for weak phrases
+        self.strong_verb_pattern = re.compile(
+            '^(?:' + '|'.join(re.escape(v) for v in self.action_verbs['strong']) + ')'
+        )
+        self.moderate_verb_pattern = re.compile(
+            '^(?:' + '|'.join(re.escape(v) for v in self.action_verbs['moderate']) + ')'
+        )
+        self.weak_phrase_pattern = re.compile('|'.join(re.escape(p) for p in self.action_verbs['weak']))
+        # Exact first-word lookups, tried before the prefix regexes above
+        self.strong_verb_set = frozenset(self.action_verbs['strong'])
+        self.moderate_verb_set = frozenset(self.action_verbs['moderate'])
+        
+        # LRU cache of complete results, see score_resume_quality
+        self.score_cache_size = 32
+        self._score_cache = OrderedDict()
+        
+        # Resumes per score_batch worker task
+        self.batch_chunk_size = 16
+        
+        self.numbered_bullet_pattern = re.compile(r'^\s*\d+[\.\)]\s*')
+        # Single leading marker character dropped before looking for the action verb
+        self.bullet_prefix_chars = frozenset('•-*▪▫0123456789.)')
+        # Maps ! and ? to . so sentences split with a plain str.split('.')
+        self.sentence_end_table = str.maketrans('!?', '..')
+        self.space_run_pattern = re.compile(r'  +')
     
     def score_resume_quality(self, extracted_text: str, extracted_data: Dict[str, Any] = None, 
                            target_skills: List[str] = None, target_experience_years: int = None,
@@ -78,22 +173,124 @@ class ResumeQualityScorer:
             ats_analysis: ATS compatibility analysis results (optional)
             
         Returns:
-            Detailed quality score with subscores and recommendations
+            Detailed quality score with subscores and recommendations.
+            Repeated calls with identical inputs return the same cached
+            result object, which must be treated as read-only.
         """
         
+        cache_key = self._score_cache_key(
+            extracted_text, extracted_data, target_skills, target_experience_years, ats_analysis
+        )
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            self._score_cache.move_to_end(cache_key)
+            return cached
+        
+        result = self._compute_quality_score(
+            extracted_text, extracted_data, target_skills, target_experience_years, ats_analysis
+        )
+        
+        self._score_cache[cache_key] = result
+        if len(self._score_cache) > self.score_cache_size:
+            self._score_cache.popitem(last=False)
+        
+        return result
+    
+    def score_batch(self, items: List[Dict[str, Any]], max_workers: int = None) -> List[Dict[str, Any]]:
+        """
+        Score many resumes in parallel worker processes
+        
+        Each item holds the keyword arguments for score_resume_quality
+        (extracted_text plus any of the optional inputs). Items are sent to
+        the workers in chunks; every worker builds one scorer and reuses it
+        for all the chunks it receives.
+        
+        Returns one quality score per item, in the same order as items
+        """
+        
+        # A single chunk (or a single worker) is not worth a process pool
+        if len(items) <= self.batch_chunk_size or max_workers == 1:
+            return self._score_chunk(items)
+        
+        chunks = [items[i:i + self.batch_chunk_size] for i in range(0, len(items), self.batch_chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker) as executor:
+            return [result for chunk_results in executor.map(_score_batch_chunk, chunks)
+                    for result in chunk_results]
+    
+    def _score_chunk(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Score a chunk of score_batch items through the score cache"""
+        return [self.score_resume_quality(**item) for item in items]
+    
+    def _score_cache_key(self, extracted_text: str, extracted_data: Dict[str, Any] = None,
+                         target_skills: List[str] = None, target_experience_years: int = None,
+                         ats_analysis: Dict[str, Any] = None) -> Tuple:
+        """
+        Hashable cache key built from the inputs the scorer actually reads
+        
+        Only the extracted_data and ats_analysis fields used in scoring are
+        keyed, so unrelated fields such as the extraction timestamp do not
+        turn identical resumes into cache misses.
+        """
+        
+        # Lone surrogates from PDF extraction must not break the key
+        text_digest = hashlib.blake2b(
+            extracted_text.encode('utf-8', 'surrogatepass'), digest_size=16
+        ).digest()
+        
+        data_key = None
+        if extracted_data:
+            skills_data = extracted_data.get("skills", {})
+            experience_data = extracted_data.get("experience", {})
+            data_key = (
+                tuple(tuple(skills_data.get(category, ())) for category in SKILL_CATEGORIES),
+                skills_data.get("total_skills_found", 0),
+                experience_data.get("total_years", 0),
+                experience_data.get("career_level", "entry")
+            )
+        
+        ats_key = None
+        if ats_analysis:
+            # Issues and format/layout details are copied into the result, so they are keyed too
+            echoed = json.dumps([
+                ats_analysis.get("priority_issues", []),
+                ats_analysis.get("file_format_analysis", {}),
+                ats_analysis.get("layout_analysis", {})
+            ], sort_keys=True, default=str)
+            ats_key = (
+                ats_analysis.get("ats_score", {}).get("total_score", 0),
+                ats_analysis.get("compatibility_level", "unknown"),
+                hashlib.blake2b(echoed.encode('utf-8'), digest_size=16).digest()
+            )
+        
+        return (
+            text_digest,
+            data_key,
+            _normalize_target_skills(tuple(target_skills)) if target_skills else None,
+            target_experience_years,
+            ats_key
+        )
+    
+    def _compute_quality_score(self, extracted_text: str, extracted_data: Dict[str, Any] = None,
+                               target_skills: List[str] = None, target_experience_years: int = None,
+                               ats_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Compute the quality score for score_resume_quality (uncached)"""
+        
         # Content Fit Scoring (40 points max)
         content_fit_score, content_fit_details = self._score_content_fit(
             extracted_data, target_skills, target_experience_years
         )
         
+        # Lines, sentences, bullets etc. are derived once for the text-based pillars
+        views = self._build_views(extracted_text)
+        
         # Clarity & Quantification Scoring (25 points max)
-        clarity_score, clarity_details = self._score_clarity_quantification(extracted_text)
+        clarity_score, clarity_details = self._score_clarity_quantification(views)
         
         # Structure & Readability Scoring (20 points max)
-        structure_score, structure_details = self._score_structure_readability(extracted_text)
+        structure_score, structure_details = self._score_structure_readability(views)
         
         # ATS Friendliness Scoring (15 points max)
-        ats_score, ats_details = self._score_ats_friendliness(ats_analysis, extracted_text)
+        ats_score, ats_details = self._score_ats_friendliness(ats_analysis, views)
         
         # Calculate total score
         total_score = content_fit_score + clarity_score + structure_score + ats_score
@@ -195,16 +392,15 @@ class ResumeQualityScorer:
         
         # Get resume skills
         skills_data = extracted_data.get("skills", {})
-        resume_skills = []
-        
-        for category in ["programming_languages", "web_technologies", "databases", "cloud_platforms", "tools_frameworks", "soft_skills"]:
-            resume_skills.extend(skills_data.get(category, []))
-        
-        resume_skills.extend(skills_data.get("matched_skills", []))
-        resume_skills_lower = set(skill.lower().strip() for skill in resume_skills if skill)
+        resume_skills_lower = {
+            skill.lower().strip()
+            for category in SKILL_CATEGORIES
+            for skill in skills_data.get(category, ())
+            if skill
+        }
         
         # Calculate coverage
-        target_skills_lower = set(skill.lower().strip() for skill in target_skills if skill)
+        target_skills_lower = _normalize_target_skills(tuple(target_skills))
         matched_skills = resume_skills_lower & target_skills_lower
         
         if target_skills_lower:
@@ -275,7 +471,7 @@ class ResumeQualityScorer:
         
         return score, analysis
     
-    def _score_clarity_quantification(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _score_clarity_quantification(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Score clarity and quantification (25 points max)"""
         
         details = {
@@ -289,28 +485,23 @@ class ResumeQualityScorer:
         total_score = 0
         
         # Metrics Usage (15 points max)
-        metrics_score, metrics_analysis = self._analyze_metrics_usage(text)
+        metrics_score, metrics_analysis = self._analyze_metrics_usage(views)
         details["metrics_score"] = metrics_score
         details["metrics_analysis"] = metrics_analysis
         total_score += metrics_score
         
         # Action Verbs (10 points max)
-        verbs_score, verbs_analysis = self._analyze_action_verbs(text)
+        verbs_score, verbs_analysis = self._analyze_action_verbs(views)
         details["action_verbs_score"] = verbs_score
         details["action_verbs_analysis"] = verbs_analysis
         total_score += verbs_score
         
         return total_score, details
     
-    def _analyze_metrics_usage(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_metrics_usage(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Analyze usage of quantifiable metrics (15 points max)"""
         
-        lines = text.split('\n')
-        bullet_lines = [line.strip() for line in lines if line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*')]
-        
-        if not bullet_lines:
-            # Also check for numbered achievements or bullet-like patterns
-            bullet_lines = [line.strip() for line in lines if re.match(r'^\s*[•\-\*▪▫]\s*', line) or re.match(r'^\s*\d+[\.\)]\s*', line)]
+        bullet_lines = views.bullets
         
         total_bullets = len(bullet_lines)
         metrics_found = []
@@ -318,10 +509,7 @@ class ResumeQualityScorer:
         
         # Find metrics in bullet points
         for line in bullet_lines:
-            line_metrics = []
-            for pattern in self.metric_patterns:
-                matches = re.findall(pattern, line, re.IGNORECASE)
-                line_metrics.extend(matches)
+            line_metrics = self.metric_union_pattern.findall(line)
             
             if line_metrics:
                 lines_with_metrics += 1
@@ -346,14 +534,10 @@ class ResumeQualityScorer:
         
         return metrics_score, analysis
     
-    def _analyze_action_verbs(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_action_verbs(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Analyze usage of strong action verbs (10 points max)"""
         
-        lines = text.split('\n')
-        bullet_lines = [line.strip() for line in lines if line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*')]
-        
-        if not bullet_lines:
-            bullet_lines = [line.strip() for line in lines if re.match(r'^\s*[•\-\*▪▫]\s*', line) or re.match(r'^\s*\d+[\.\)]\s*', line)]
+        bullet_lines = views.bullets
         
         total_bullets = len(bullet_lines)
         verb_analysis = {
@@ -367,42 +551,38 @@ class ResumeQualityScorer:
         
         for line in bullet_lines:
             # Extract the first few words to check for action verbs
-            clean_line = re.sub(r'^[•\-\*▪▫\d\.\)]\s*', '', line).strip()
+            clean_line = line[1:].strip() if line[:1] in self.bullet_prefix_chars else line.strip()
             first_words = clean_line.split()[:3]
             first_phrase = ' '.join(first_words).lower()
             
-            verb_found = False
-            verb_strength = 'none'
+            # Fast path: first word is exactly a known verb. No verb is a prefix
+            # of another, so this agrees with the prefix regexes below.
+            first_word = first_phrase.partition(' ')[0]
+            if first_word in self.strong_verb_set:
+                verb_analysis['strong'] += 1
+                found_verbs.append(first_word)
+                continue
+            if first_word in self.moderate_verb_set:
+                verb_analysis['moderate'] += 1
+                found_verbs.append(first_word)
+                continue
             
-            # Check for strong verbs
-            for verb in self.action_verbs['strong']:
-                if first_phrase.startswith(verb):
-                    verb_analysis['strong'] += 1
-                    found_verbs.append(verb)
-                    verb_found = True
-                    verb_strength = 'strong'
-                    break
+            # Check for strong verbs, then moderate verbs, then weak patterns
+            verb_match = self.strong_verb_pattern.match(first_phrase)
+            if verb_match:
+                verb_analysis['strong'] += 1
+                found_verbs.append(verb_match.group())
+                continue
             
-            # Check for moderate verbs if no strong verb found
-            if not verb_found:
-                for verb in self.action_verbs['moderate']:
-                    if first_phrase.startswith(verb):
-                        verb_analysis['moderate'] += 1
-                        found_verbs.append(verb)
-                        verb_found = True
-                        verb_strength = 'moderate'
-                        break
+            verb_match = self.moderate_verb_pattern.match(first_phrase)
+            if verb_match:
+                verb_analysis['moderate'] += 1
+                found_verbs.append(verb_match.group())
+                continue
             
-            # Check for weak patterns
-            if not verb_found:
-                for pattern in self.action_verbs['weak']:
-                    if pattern in first_phrase:
-                        verb_analysis['weak'] += 1
-                        verb_found = True
-                        verb_strength = 'weak'
-                        break
-            
-            if not verb_found:
+            if self.weak_phrase_pattern.search(first_phrase):
+                verb_analysis['weak'] += 1
+            else:
                 verb_analysis['none'] += 1
         
         # Calculate score
@@ -426,7 +606,46 @@ class ResumeQualityScorer:
         
         return verb_score, analysis
     
-    def _score_structure_readability(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _build_views(self, text: str) -> _TextViews:
+        """Derive the text views shared by the scoring pillars"""
+        
+        # Split into sentences; empty pieces from runs of terminators are dropped
+        sentences = (s.strip() for s in text.translate(self.sentence_end_table).split('.'))
+        
+        lines = tuple(text.split('\n'))
+        return _TextViews(
+            raw=text,
+            lines=lines,
+            lower_lines=tuple(text.lower().split('\n')),
+            sentences=tuple(s for s in sentences if len(s) > 10),
+            bullets=self._extract_bullet_lines(lines)
+        )
+    
+    def _extract_bullet_lines(self, lines: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Stripped bullet lines, shared by the metrics and action verb analyses
+        
+        Lines starting with •, - or * are bullets. If there are none, lines
+        starting with ▪/▫ or a number like "1." / "2)" are used instead.
+        """
+        bullet_lines = []
+        fallback_lines = []
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith(('•', '-', '*')):
+                if not bullet_lines:
+                    fallback_lines = []  # No longer needed once a real bullet is seen
+                bullet_lines.append(stripped)
+            elif bullet_lines:
+                continue
+            elif stripped.startswith(('▪', '▫')) or (
+                    stripped[:1].isdigit() and self.numbered_bullet_pattern.match(stripped)):
+                # Numbered achievements or other bullet-like markers
+                fallback_lines.append(stripped)
+        
+        return tuple(bullet_lines or fallback_lines)
+    
+    def _score_structure_readability(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Score structure and readability (20 points max)"""
         
         details = {
@@ -440,40 +659,37 @@ class ResumeQualityScorer:
         total_score = 0
         
         # Key Sections (10 points max)
-        sections_score, sections_analysis = self._analyze_key_sections(text)
+        sections_score, sections_analysis = self._analyze_key_sections(views)
         details["sections_score"] = sections_score
         details["sections_analysis"] = sections_analysis
         total_score += sections_score
         
         # Readability (10 points max)
-        readability_score, readability_analysis = self._analyze_readability(text)
+        readability_score, readability_analysis = self._analyze_readability(views)
         details["readability_score"] = readability_score
         details["readability_analysis"] = readability_analysis
         total_score += readability_score
         
         return total_score, details
     
-    def _analyze_key_sections(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_key_sections(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Analyze presence of key resume sections (10 points max)"""
         
-        text_lower = text.lower()
-        sections_found = {}
-        
-        for section_name, keywords in self.required_sections.items():
-            found = False
-            for keyword in keywords:
-                # Look for keywords as section headers (short lines)
-                lines = text.split('\n')
-                for line in lines:
-                    line_clean = line.strip().lower()
-                    if len(line_clean) < 50 and keyword in line_clean:
-                        # Additional check: line should be relatively standalone
-                        if any(kw == line_clean or line_clean.startswith(kw) for kw in keywords):
-                            found = True
-                            break
-                if found:
-                    break
-            sections_found[section_name] = found
+        sections_found = {section_name: False for section_name in self.required_sections}
+        remaining = dict(self.section_keyword_prefixes)
+        
+        # One pass over the lines: a section counts as present when a short line
+        # (a likely header) starts with one of its keywords
+        for line in views.lower_lines:
+            line_clean = line.strip()
+            if len(line_clean) >= 50:
+                continue
+            for section_name, prefixes in list(remaining.items()):
+                if line_clean.startswith(prefixes):
+                    sections_found[section_name] = True
+                    del remaining[section_name]
+            if not remaining:
+                break
         
         # Calculate score
         found_count = sum(sections_found.values())
@@ -491,46 +707,33 @@ class ResumeQualityScorer:
         
         return sections_score, analysis
     
-    def _analyze_readability(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _analyze_readability(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Analyze sentence length and passive voice (10 points max)"""
         
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
+        sentences = views.sentences
         
         if not sentences:
             return 0, {"error": "No readable sentences found"}
         
-        # Analyze sentence lengths
+        # Per-sentence word counts and passive voice flags
         sentence_lengths = [len(s.split()) for s in sentences]
-        avg_sentence_length = statistics.mean(sentence_lengths) if sentence_lengths else 0
-        long_sentences = [s for s in sentence_lengths if s > 25]  # Consider >25 words as long
-        
-        # Analyze passive voice patterns
-        passive_patterns = [
-            r'\b(?:was|were|is|are|been|being)\s+\w+ed\b',  # was/were + past participle
-            r'\b(?:was|were|is|are)\s+\w+en\b',  # was/were + past participle ending in 'en'
-            r'\bby\s+(?:the\s+)?[A-Z]\w*',  # "by [Company/Person]" pattern
-        ]
+        passive_flags = [self.passive_union_pattern.search(s) is not None for s in sentences]
         
-        passive_sentences = 0
-        for sentence in sentences:
-            for pattern in passive_patterns:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    passive_sentences += 1
-                    break
+        avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths)
+        long_sentences_count = sum(1 for length in sentence_lengths if length > 25)  # Consider >25 words as long
+        passive_sentences = sum(passive_flags)
+        passive_percentage = passive_sentences / len(sentences)
         
         # Calculate readability score
         readability_score = 10  # Start with max points
         
         # Deduct for overly long sentences
-        if len(long_sentences) > len(sentences) * 0.3:  # More than 30% long sentences
+        if long_sentences_count > len(sentences) * 0.3:  # More than 30% long sentences
             readability_score -= 3
-        elif len(long_sentences) > len(sentences) * 0.2:  # More than 20% long sentences
+        elif long_sentences_count > len(sentences) * 0.2:  # More than 20% long sentences
             readability_score -= 2
         
         # Deduct for excessive passive voice
-        passive_percentage = passive_sentences / len(sentences) if sentences else 0
         if passive_percentage > 0.3:  # More than 30% passive
             readability_score -= 4
         elif passive_percentage > 0.2:  # More than 20% passive
@@ -547,16 +750,16 @@ class ResumeQualityScorer:
         analysis = {
             "total_sentences": len(sentences),
             "average_sentence_length": round(avg_sentence_length, 1),
-            "long_sentences_count": len(long_sentences),
-            "long_sentences_percentage": round((len(long_sentences) / len(sentences)) * 100, 1),
+            "long_sentences_count": long_sentences_count,
+            "long_sentences_percentage": round((long_sentences_count / len(sentences)) * 100, 1),
             "passive_sentences_count": passive_sentences,
             "passive_voice_percentage": round(passive_percentage * 100, 1),
             "readability_issues": []
         }
         
         # Add specific issues
-        if len(long_sentences) > len(sentences) * 0.2:
-            analysis["readability_issues"].append(f"{len(long_sentences)} sentences are too long (>25 words)")
+        if long_sentences_count > len(sentences) * 0.2:
+            analysis["readability_issues"].append(f"{long_sentences_count} sentences are too long (>25 words)")
         if passive_percentage > 0.2:
             analysis["readability_issues"].append(f"{passive_sentences} sentences use passive voice")
         if avg_sentence_length < 5:
@@ -566,7 +769,7 @@ class ResumeQualityScorer:
         
         return readability_score, analysis
     
-    def _score_ats_friendliness(self, ats_analysis: Dict[str, Any] = None, text: str = None) -> Tuple[float, Dict[str, Any]]:
+    def _score_ats_friendliness(self, ats_analysis: Dict[str, Any] = None, views: _TextViews = None) -> Tuple[float, Dict[str, Any]]:
         """Score ATS friendliness (15 points max)"""
         
         if ats_analysis:
@@ -593,19 +796,46 @@ class ResumeQualityScorer:
             
         else:
             # Fallback: basic ATS heuristics from text analysis
-            score, details = self._basic_ats_analysis(text)
+            score, details = self._basic_ats_analysis(views)
         
         return score, details
     
-    def _basic_ats_analysis(self, text: str) -> Tuple[float, Dict[str, Any]]:
+    def _count_special_characters(self, text: str) -> Tuple[int, int]:
+        """Occurrences of problematic symbols and complex formatting characters in the text"""
+        
+        if NUMPY_AVAILABLE:
+            import numpy as np
+            problematic_codepoints, complex_formatting_codepoints = self._special_codepoint_arrays()
+            # Vectorized over the code points; surrogatepass keeps stray surrogates encodable
+            codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+            return (
+                int(np.count_nonzero(np.isin(codepoints, problematic_codepoints))),
+                int(np.count_nonzero(np.isin(codepoints, complex_formatting_codepoints)))
+            )
+        
+        return (
+            sum(text.count(symbol) for symbol in self.problematic_symbols),
+            sum(len(pattern.findall(text)) for pattern in self.complex_formatting_patterns)
+        )
+    
+    def _special_codepoint_arrays(self) -> Tuple[Any, Any]:
+        """Sorted code points of the counted characters, built on first use (imports numpy)"""
+        if self._special_codepoints is None:
+            import numpy as np
+            self._special_codepoints = (
+                np.array(sorted(map(ord, self.problematic_symbols)), dtype=np.uint32),
+                np.array(sorted(map(ord, self.complex_formatting_chars)), dtype=np.uint32)
+            )
+        return self._special_codepoints
+    
+    def _basic_ats_analysis(self, views: _TextViews) -> Tuple[float, Dict[str, Any]]:
         """Basic ATS analysis when detailed analysis not available (15 points max)"""
         
         score = 15  # Start with max points
         issues = []
         
         # Check for problematic symbols
-        problematic_symbols = ['★', '☆', '●', '◆', '▲', '▼', '♦', '♠', '♥', '♣', '✓', '✗', '→', '←']
-        symbol_count = sum(text.count(symbol) for symbol in problematic_symbols)
+        symbol_count, complex_formatting = self._count_special_characters(views.raw)
         
         if symbol_count > 5:
             score -= 5
@@ -615,21 +845,19 @@ class ResumeQualityScorer:
             issues.append(f"Some special symbols detected ({symbol_count} found)")
         
         # Check for table-like structures (multiple tabs or excessive spacing)
-        lines = text.split('\n')
-        table_like_lines = [line for line in lines if line.count('\t') > 2 or len(re.findall(r'  +', line)) > 3]
+        # Every run of 2+ spaces holds at least one '  ', so count('  ') rules out most
+        # lines before the exact run count
+        lines = views.lines
+        table_like_lines = [
+            line for line in lines
+            if line.count('\t') > 2 or (line.count('  ') > 3 and len(self.space_run_pattern.findall(line)) > 3)
+        ]
         
         if len(table_like_lines) > len(lines) * 0.2:  # More than 20% table-like
             score -= 4
             issues.append("Potential table formatting detected")
         
         # Check for complex formatting patterns
-        complex_patterns = [
-            r'[│┌┐└┘├┤┬┴┼]',  # Box drawing characters
-            r'[═║╔╗╚╝╠╣╦╩╬]',  # Double box drawing
-            r'[▓▒░]',  # Block characters
-        ]
-        
-        complex_formatting = sum(len(re.findall(pattern, text)) for pattern in complex_patterns)
         if complex_formatting > 0:
             score -= 3
             issues.append("Complex formatting characters detected")
@@ -719,9 +947,23 @@ class ResumeQualityScorer:
             return "needs_improvement"
 
 
+# Scorer owned by each score_batch worker process
+_batch_worker_scorer = None
+
+
+def _init_batch_worker():
+    """Build the worker's scorer once so its compiled patterns are reused"""
+    global _batch_worker_scorer
+    _batch_worker_scorer = ResumeQualityScorer()
+
+
+def _score_batch_chunk(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Score one chunk of score_batch items in a worker process"""
+    return _batch_worker_scorer._score_chunk(items)
+
+
 def main():
     """Main function for command line testing"""
-    import json
     import sys
     
     if len(sys.argv) < 2:
@@ -0,0 +1,22 @@
+"""
+Indented JSON output shared by the command line tools and the API demo
+Uses orjson when installed, otherwise the standard json module
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional faster encoder
+    orjson = None  # type: ignore[assignment]
+
+
+def dump_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when available"""
+    if orjson is not None:
+        # json.dumps accepts non-string keys and numpy floats; keep orjson on par
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
@@ -7,10 +7,10 @@ Serves the enhanced JSON analysis with all implemented features
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+import logging
 import tempfile
 import os
 import sys
-import traceback
 from typing import Optional
 import uvicorn
 from dotenv import load_dotenv
@@ -18,12 +18,18 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Add the current backend directory to the path
+logger = logging.getLogger(__name__)
+
+# Add the repository root to the path so the backend package (and its
+# relative imports) resolve when this file is run from inside backend/
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
+sys.path.insert(0, os.path.dirname(current_dir))
 
 try:
-    from api.resume_analysis_api import analyze_resume_api
+    from backend.api.resume_analysis_api import analyze_resume_api
+    # The API imports the parsing stack lazily; load it now so a broken
+    # install fails at startup instead of on every request
+    import backend.parsers.document_coordinator
 except ImportError as e:
     print(f"Import error: {e}")
     print(f"Current directory: {current_dir}")
@@ -141,8 +147,7 @@ async def analyze_resume(
             )
             
         except Exception as analysis_error:
-            print(f"Analysis error: {str(analysis_error)}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Analysis error: %s", analysis_error)
             
             return JSONResponse(
                 status_code=500,
@@ -155,8 +160,7 @@ async def analyze_resume(
             )
     
     except Exception as e:
-        print(f"Server error: {str(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Server error: %s", e)
         
         return JSONResponse(
             status_code=500,
@@ -5,7 +5,7 @@ Main document parser that orchestrates PDF/DOCX extraction and section detection
 import json
 import sys
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .pdf_text_extractor import extract_pdf_text
 from .word_document_extractor import extract_docx_text
 from .resume_section_detector import SectionDetector
@@ -14,11 +14,19 @@ from .data_extractor import InformationExtractor
 from ..ai_services.gemini_ai_service import GeminiAnalyzer
 from ..analyzers.ats_compatibility_analyzer import ATSAnalyzer
 from ..analyzers.resume_quality_scorer import ResumeQualityScorer
+from ..json_output import dump_json
+
+# Shared across calls so their tables and caches persist between requests
+_SECTION_DETECTOR = SectionDetector()
+_INFORMATION_EXTRACTOR = InformationExtractor()
+_ATS_ANALYZER = ATSAnalyzer()
+_QUALITY_SCORER = ResumeQualityScorer()
 
 
 def parse_document(file_path: str, job_description: str = None, job_title: str = None, 
                   company: str = None, required_skills: list = None, 
-                  preferred_skills: list = None) -> Dict[str, Any]:
+                  preferred_skills: list = None,
+                  file_bytes: Optional[bytes] = None) -> Dict[str, Any]:
     """
     Parse a resume document and extract structured information
     
@@ -29,6 +37,8 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
         company: Optional company name for context
         required_skills: Optional list of required skills
         preferred_skills: Optional list of preferred skills
+        file_bytes: Optional document contents already read by the caller;
+            skips the existence check and reopening the file for text extraction
         
     Returns:
         Complete parsing results including text extraction and section detection
@@ -69,13 +79,15 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
     }
     
     try:
-        # Validate file exists
-        if not os.path.exists(file_path):
-            result["error"] = f"File not found: {file_path}"
-            return result
-        
-        # Get file info
-        file_size = os.path.getsize(file_path)
+        # Get file info (validates the file exists unless contents were supplied)
+        if file_bytes is not None:
+            file_size = len(file_bytes)
+        else:
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError:
+                result["error"] = f"File not found: {file_path}"
+                return result
         result["file_info"].update({
             "size_bytes": file_size,
             "size_mb": round(file_size / (1024 * 1024), 2)
@@ -85,9 +97,9 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
         
         # Step 1: Extract text based on file type
         if extension == ".pdf":
-            text_result = extract_pdf_text(file_path)
+            text_result = extract_pdf_text(file_path, file_bytes=file_bytes)
         elif extension in [".docx", ".doc"]:
-            text_result = extract_docx_text(file_path)
+            text_result = extract_docx_text(file_path, file_bytes=file_bytes)
         else:
             result["error"] = f"Unsupported file type: {extension}"
             return result
@@ -119,8 +131,7 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
         # Step 3: Extract structured information
         information_extraction = {}
         if normalized_text.strip():
-            extractor = InformationExtractor()
-            information_extraction = extractor.extract_all_information(extracted_text, normalized_text)
+            information_extraction = _INFORMATION_EXTRACTOR.extract_all_information(extracted_text, normalized_text)
         else:
             information_extraction = {
                 "success": False,
@@ -155,8 +166,7 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
         # Step 6: Comprehensive ATS compatibility analysis
         ats_analysis = {}
         if extracted_text.strip():
-            ats_analyzer = ATSAnalyzer()
-            ats_analysis = ats_analyzer.analyze_ats_compatibility(
+            ats_analysis = _ATS_ANALYZER.analyze_ats_compatibility(
                 file_path, 
                 extracted_text, 
                 information_extraction
@@ -191,8 +201,7 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
             if preferred_skills:
                 target_skills_combined.extend(preferred_skills)
             
-            quality_scorer = ResumeQualityScorer()
-            quality_analysis = quality_scorer.score_resume_quality(
+            quality_analysis = _QUALITY_SCORER.score_resume_quality(
                 extracted_text,
                 information_extraction,
                 target_skills_combined if target_skills_combined else None,
@@ -209,8 +218,7 @@ def parse_document(file_path: str, job_description: str = None, job_title: str =
         
         # Step 8: Detect sections using normalized text (legacy support)
         if normalized_text.strip():
-            detector = SectionDetector()
-            section_result = detector.detect_sections(normalized_text)
+            section_result = _SECTION_DETECTOR.detect_sections(normalized_text)
             result["section_detection"] = section_result
         else:
             result["section_detection"]["error"] = "No text available for section detection"
@@ -376,7 +384,7 @@ def main():
         preferred_skills=preferred_skills
     )
     
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(dump_json(result))
 
 
 if __name__ == "__main__":
@@ -4,18 +4,24 @@ Uses PyPDF2 for PDF text extraction
 """
 
 import PyPDF2
+import io
 import json
+import logging
 import sys
 import os
 from typing import Dict, Any, Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
-def extract_pdf_text(file_path: str) -> Dict[str, Any]:
+
+def extract_pdf_text(file_path: str, file_bytes: Optional[bytes] = None) -> Dict[str, Any]:
     """
     Extract text from PDF using PyPDF2
     
     Args:
         file_path: Path to the PDF file
+        file_bytes: Optional file contents already read by the caller; when
+            given, the file is not reopened from disk
         
     Returns:
         Dictionary containing extraction results
@@ -31,11 +37,18 @@ def extract_pdf_text(file_path: str) -> Dict[str, Any]:
     }
     
     try:
-        if not os.path.exists(file_path):
+        if file_bytes is not None:
+            source = io.BytesIO(file_bytes)
+            file_size = len(file_bytes)
+        elif not os.path.exists(file_path):
             result["error"] = f"File not found: {file_path}"
             return result
+        else:
+            # Size first, so a failing getsize cannot leak an open handle
+            file_size = os.path.getsize(file_path)
+            source = open(file_path, 'rb')
             
-        with open(file_path, 'rb') as file:
+        with source as file:
             pdf_reader = PyPDF2.PdfReader(file)
             
             # Extract metadata
@@ -61,7 +74,7 @@ def extract_pdf_text(file_path: str) -> Dict[str, Any]:
                     if page_text.strip():
                         text_parts.append(page_text)
                 except Exception as e:
-                    print(f"Warning: Failed to extract text from page {page_num + 1}: {e}")
+                    logger.warning("Failed to extract text from page %d: %s", page_num + 1, e)
                     continue
             
             full_text = "\n".join(text_parts)
@@ -75,7 +88,7 @@ def extract_pdf_text(file_path: str) -> Dict[str, Any]:
                 "metadata": {
                     "page_count": page_count,
                     "pdf_metadata": metadata,
-                    "file_size": os.path.getsize(file_path)
+                    "file_size": file_size
                 },
                 "is_scanned": is_scanned,
                 "char_count": len(full_text)
@@ -6,8 +6,15 @@ Identifies common resume sections using pattern matching
 import re
 import json
 import sys
+import hashlib
+from collections import OrderedDict
 from typing import Dict, List, Any, Tuple
 
+try:
+    import ahocorasick
+except ImportError:  # Optional single-pass keyword matching
+    ahocorasick = None
+
 
 class SectionDetector:
     """Detects and analyzes resume sections"""
@@ -93,6 +100,67 @@ class SectionDetector:
             "github": r"(?:github\.com/)([A-Za-z0-9-]+)",
             "website": r"(?:https?://)?(www\.)?([A-Za-z0-9-]+\.[A-Za-z]{2,})"
         }
+        
+        # Section-specific keywords that boost detection confidence
+        self.confidence_keywords = {
+            "experience": ("worked", "responsible", "managed", "developed", "led", "achieved"),
+            "education": ("university", "college", "degree", "bachelor", "master", "phd", "gpa"),
+            "skills": ("proficient", "experienced", "knowledge", "familiar", "programming"),
+            "projects": ("project", "developed", "built", "created", "implemented"),
+            "certifications": ("certified", "license", "credential", "certification")
+        }
+        
+        # Section-specific keywords reported in keywords_found
+        self.section_keywords = {
+            "experience": ("worked", "responsible", "managed", "developed", "led", "achieved"),
+            "education": ("university", "college", "degree", "bachelor", "master", "phd"),
+            "skills": ("proficient", "experienced", "knowledge", "programming", "software"),
+            "projects": ("project", "developed", "built", "created", "implemented"),
+            "certifications": ("certified", "license", "credential", "certification")
+        }
+        
+        # One Aho-Corasick automaton per section type over both keyword tables,
+        # so a section's content is scanned once for all of its keywords
+        self.keyword_automata = {}
+        if ahocorasick is not None:
+            for section_type in self.confidence_keywords:
+                automaton = ahocorasick.Automaton()
+                for keyword in self.confidence_keywords[section_type] + self.section_keywords.get(section_type, ()):
+                    automaton.add_word(keyword, keyword)
+                automaton.make_automaton()
+                self.keyword_automata[section_type] = automaton
+        
+        # Sections counted towards structure quality
+        self.essential_sections = frozenset({"experience", "education", "skills"})
+        
+        # Compiled once per detector; detection runs them against every line.
+        # Each section type's patterns are fused into one alternation, and all of
+        # them into section_header_pattern, so most lines need a single search.
+        self.section_regexes = {
+            section_type: re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+            for section_type, patterns in self.section_patterns.items()
+        }
+        self.section_header_pattern = re.compile(
+            '|'.join(regex.pattern for regex in self.section_regexes.values()), re.IGNORECASE
+        )
+        # The same union run over the whole text. [^\S\n] keeps every match on one
+        # line, and the MULTILINE ^ makes each match start at the beginning of its
+        # line, so a line yields at most one match
+        self.section_header_line_pattern = re.compile(
+            r'^[^\n]*?(?:' + self.section_header_pattern.pattern.replace(r'\s', r'[^\S\n]') + ')',
+            re.IGNORECASE | re.MULTILINE
+        )
+        # The phone pattern's captured separators are '-', '.' and whitespace; deleting
+        # them leaves the digits and '+' that were kept by re.sub(r'[^\d+]', '', phone)
+        self.phone_separator_table = str.maketrans('', '', '-.')
+        self.contact_regexes = {
+            info_type: re.compile(pattern, re.IGNORECASE)
+            for info_type, pattern in self.contact_patterns.items()
+        }
+        
+        # LRU cache of detection results keyed by text digest, see detect_sections
+        self.cache_size = 256
+        self._cache = OrderedDict()
     
     def detect_sections(self, text: str) -> Dict[str, Any]:
         """
@@ -102,8 +170,36 @@ class SectionDetector:
             text: Resume text content
             
         Returns:
-            Dictionary containing detected sections and analysis
+            Dictionary containing detected sections and analysis.
+            Repeated calls with the same text return the same cached
+            result object, which must be treated as read-only.
         """
+        # Blank text (e.g. a failed OCR pass) has nothing to match
+        if not text or text.isspace():
+            return {
+                "success": True,
+                "sections": [],
+                "contact_info": {},
+                "structure_analysis": self._analyze_structure([], {}),
+                "error": None
+            }
+        
+        cache_key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+        
+        result = self._detect_sections(text)
+        
+        self._cache[cache_key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        
+        return result
+    
+    def _detect_sections(self, text: str) -> Dict[str, Any]:
+        """Detect resume sections from text (uncached)"""
         result = {
             "success": False,
             "sections": [],
@@ -113,39 +209,47 @@ class SectionDetector:
         }
         
         try:
-            lines = text.split('\n')
-            sections = []
+            total_lines = text.count('\n') + 1
+            sections_by_type = {}  # First section of each type, in document order
             contact_info = self._extract_contact_info(text)
             
-            # Find section headers
-            for i, line in enumerate(lines):
-                line_clean = line.strip()
-                if not line_clean:
+            # Find section headers in one pass; each section's content runs to the next header
+            header_lines = self._find_header_lines(text)
+            next_header_starts = [line_start for _, line_start, _ in header_lines[1:]] + [len(text)]
+            
+            for (i, line_start, line_end), next_header_start in zip(header_lines, next_header_starts):
+                line_clean = text[line_start:line_end].strip()
+                
+                # A header line can name several sections ("Skills and Projects");
+                # later headers of an already-found type are duplicates and skipped
+                section_types = [
+                    section_type for section_type, regex in self.section_regexes.items()
+                    if section_type not in sections_by_type and regex.search(line_clean)
+                ]
+                if not section_types:
                     continue
                 
-                # Check if line matches any section pattern
-                for section_type, patterns in self.section_patterns.items():
-                    for pattern in patterns:
-                        if re.search(pattern, line_clean, re.IGNORECASE):
-                            # Find section content
-                            section_content = self._extract_section_content(lines, i)
-                            confidence = self._calculate_confidence(section_type, section_content)
-                            
-                            section = {
-                                "type": section_type,
-                                "title": line_clean,
-                                "content": section_content,
-                                "start_line": i + 1,
-                                "end_line": min(i + len(section_content.split('\n')), len(lines)),
-                                "confidence": confidence,
-                                "keywords_found": self._find_keywords(section_type, section_content),
-                                "word_count": len(section_content.split())
-                            }
-                            sections.append(section)
-                            break
+                section_content, content_line_count, word_count = self._extract_section_content(
+                    text, line_end + 1, next_header_start
+                )
+                content_lower = section_content.lower()
+                
+                for section_type in section_types:
+                    confidence, keywords_found = self._confidence_and_keywords(section_type, content_lower)
+                    
+                    section = {
+                        "type": section_type,
+                        "title": line_clean,
+                        "content": section_content,
+                        "start_line": i + 1,
+                        "end_line": min(i + max(content_line_count, 1), total_lines),
+                        "confidence": confidence,
+                        "keywords_found": keywords_found,
+                        "word_count": word_count
+                    }
+                    sections_by_type[section_type] = section
             
-            # Remove duplicates and overlaps
-            sections = self._remove_duplicate_sections(sections)
+            sections = list(sections_by_type.values())
             
             # Structure analysis
             structure_analysis = self._analyze_structure(sections, contact_info)
@@ -162,132 +266,130 @@ class SectionDetector:
             
         return result
     
+    def _find_header_lines(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Lines containing a section header, from one scan of the whole text
+        
+        Returns (line index, start offset, end offset) per line in text order;
+        the end offset is that of the line's newline, or len(text) for the last line
+        """
+        header_lines = []
+        line_index = 0
+        previous_start = 0
+        
+        for match in self.section_header_line_pattern.finditer(text):
+            line_start = match.start()
+            line_index += text.count('\n', previous_start, line_start)
+            previous_start = line_start
+            
+            line_end = text.find('\n', match.end())
+            header_lines.append((line_index, line_start, len(text) if line_end == -1 else line_end))
+        
+        return header_lines
+    
     def _extract_contact_info(self, text: str) -> Dict[str, str]:
         """Extract contact information from text"""
         contact_info = {}
         
-        for info_type, pattern in self.contact_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                if info_type == "phone":
-                    # Clean up phone number
-                    phone_match = matches[0]
-                    if isinstance(phone_match, tuple):
-                        phone = ''.join(phone_match)
-                    else:
-                        phone = phone_match
-                    contact_info[info_type] = re.sub(r'[^\d+]', '', phone)
-                elif info_type in ["linkedin", "github"]:
-                    contact_info[info_type] = matches[0]
+        if not text or text.isspace():
+            return contact_info
+        
+        for info_type, regex in self.contact_regexes.items():
+            # Only the first match is used, so stop scanning there
+            match = regex.search(text)
+            if not match:
+                continue
+            
+            # Same value re.findall would give for that match
+            if regex.groups == 0:
+                first_match = match.group()
+            elif regex.groups == 1:
+                first_match = match.groups('')[0]
+            else:
+                first_match = match.groups('')
+            
+            if info_type == "phone":
+                # Clean up phone number
+                if isinstance(first_match, tuple):
+                    phone = ''.join(first_match)
                 else:
-                    contact_info[info_type] = matches[0]
+                    phone = first_match
+                contact_info[info_type] = ''.join(phone.translate(self.phone_separator_table).split())
+            else:
+                contact_info[info_type] = first_match
         
         return contact_info
     
-    def _extract_section_content(self, lines: List[str], start_index: int) -> str:
-        """Extract content for a section starting at given index"""
+    def _extract_section_content(self, text: str, start: int, end: int) -> Tuple[str, int, int]:
+        """
+        Extract content for a section from text[start:end], the lines between its header and the next
+        
+        Lines are read one at a time straight from the text, so only the
+        (at most 21) kept lines are copied. Returns the content with its line
+        and word counts, tallied while it is assembled.
+        """
         content_lines = []
+        word_count = 0
         
-        # Look ahead for content until next section or end
-        for i in range(start_index + 1, len(lines)):
-            line = lines[i].strip()
+        position = start
+        while position < end:
+            line_end = text.find('\n', position, end)
+            if line_end == -1:
+                line_end = end
+            line = text[position:line_end].strip()
+            position = line_end + 1
             
-            # Stop if we hit another section header
-            if self._is_section_header(line):
-                break
-                
             if line:  # Only add non-empty lines
                 content_lines.append(line)
+                word_count += len(line.split())
             
             # Limit content length
             if len(content_lines) > 20:
                 break
         
-        return '\n'.join(content_lines)
+        return '\n'.join(content_lines), len(content_lines), word_count
     
-    def _is_section_header(self, line: str) -> bool:
-        """Check if line is likely a section header"""
-        for patterns in self.section_patterns.values():
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    return True
-        return False
-    
-    def _calculate_confidence(self, section_type: str, content: str) -> float:
-        """Calculate confidence score for section detection"""
-        base_confidence = 0.7
-        
-        # Section-specific keywords for confidence boost
-        keywords = {
-            "experience": ["worked", "responsible", "managed", "developed", "led", "achieved"],
-            "education": ["university", "college", "degree", "bachelor", "master", "phd", "gpa"],
-            "skills": ["proficient", "experienced", "knowledge", "familiar", "programming"],
-            "projects": ["project", "developed", "built", "created", "implemented"],
-            "certifications": ["certified", "license", "credential", "certification"]
-        }
-        
-        if section_type in keywords:
-            keyword_count = sum(1 for keyword in keywords[section_type] 
-                              if keyword.lower() in content.lower())
-            confidence_boost = min(keyword_count * 0.05, 0.3)
-            base_confidence += confidence_boost
-        
-        return min(base_confidence, 1.0)
-    
-    def _find_keywords(self, section_type: str, content: str) -> List[str]:
-        """Find relevant keywords in section content"""
-        keywords = {
-            "experience": ["worked", "responsible", "managed", "developed", "led", "achieved"],
-            "education": ["university", "college", "degree", "bachelor", "master", "phd"],
-            "skills": ["proficient", "experienced", "knowledge", "programming", "software"],
-            "projects": ["project", "developed", "built", "created", "implemented"],
-            "certifications": ["certified", "license", "credential", "certification"]
-        }
-        
-        found_keywords = []
-        if section_type in keywords:
-            content_lower = content.lower()
-            found_keywords = [kw for kw in keywords[section_type] 
-                            if kw in content_lower]
+    def _confidence_and_keywords(self, section_type: str, content_lower: str) -> Tuple[float, List[str]]:
+        """Calculate detection confidence and find relevant keywords in lowercased section content"""
+        confidence = 0.7
         
-        return found_keywords
-    
-    def _remove_duplicate_sections(self, sections: List[Dict]) -> List[Dict]:
-        """Remove duplicate or overlapping sections"""
-        # Sort by start line
-        sections.sort(key=lambda x: x["start_line"])
+        # Substring test per keyword, answered from one automaton pass when available
+        automaton = self.keyword_automata.get(section_type)
+        if automaton is not None:
+            contains = {keyword for _, keyword in automaton.iter(content_lower)}.__contains__
+        else:
+            contains = content_lower.__contains__
         
-        # Remove duplicates by type
-        seen_types = set()
-        unique_sections = []
+        if section_type in self.confidence_keywords:
+            keyword_count = sum(1 for keyword in self.confidence_keywords[section_type]
+                                if contains(keyword))
+            confidence += min(keyword_count * 0.05, 0.3)
         
-        for section in sections:
-            if section["type"] not in seen_types:
-                unique_sections.append(section)
-                seen_types.add(section["type"])
+        found_keywords = [keyword for keyword in self.section_keywords.get(section_type, ())
+                          if contains(keyword)]
         
-        return unique_sections
+        return min(confidence, 1.0), found_keywords
     
     def _analyze_structure(self, sections: List[Dict], contact_info: Dict) -> Dict[str, Any]:
         """Analyze overall resume structure"""
         section_types = [s["type"] for s in sections]
+        type_set = set(section_types)
+        
+        has_essentials = len(self.essential_sections & type_set)
         
         analysis = {
             "total_sections": len(sections),
             "sections_found": section_types,
             "has_contact": bool(contact_info),
-            "has_experience": "experience" in section_types,
-            "has_education": "education" in section_types,
-            "has_skills": "skills" in section_types,
+            "has_experience": "experience" in type_set,
+            "has_education": "education" in type_set,
+            "has_skills": "skills" in type_set,
             "avg_confidence": sum(s["confidence"] for s in sections) / len(sections) if sections else 0,
             "structure_quality": "unknown",
             "recommendations": []
         }
         
         # Determine structure quality
-        essential_sections = ["experience", "education", "skills"]
-        has_essentials = sum(1 for sec in essential_sections if sec in section_types)
-        
         if has_essentials >= 3 and contact_info:
             analysis["structure_quality"] = "excellent"
         elif has_essentials >= 2:
@@ -300,11 +402,11 @@ class SectionDetector:
         # Generate recommendations
         if not contact_info:
             analysis["recommendations"].append("Add contact information")
-        if "experience" not in section_types:
+        if "experience" not in type_set:
             analysis["recommendations"].append("Add work experience section")
-        if "education" not in section_types:
+        if "education" not in type_set:
             analysis["recommendations"].append("Add education section")
-        if "skills" not in section_types:
+        if "skills" not in type_set:
             analysis["recommendations"].append("Add skills section")
         
         return analysis
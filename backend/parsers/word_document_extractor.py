@@ -3,19 +3,22 @@ DOCX text extraction for resume parsing
 Uses python-docx library for Word document parsing
 """
 
+import io
 import json
 import sys
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from docx import Document
 
 
-def extract_docx_text(file_path: str) -> Dict[str, Any]:
+def extract_docx_text(file_path: str, file_bytes: Optional[bytes] = None) -> Dict[str, Any]:
     """
     Extract text from DOCX using python-docx
     
     Args:
         file_path: Path to the DOCX file
+        file_bytes: Optional file contents already read by the caller; when
+            given, the file is not reopened from disk
         
     Returns:
         Dictionary containing extraction results
@@ -30,12 +33,18 @@ def extract_docx_text(file_path: str) -> Dict[str, Any]:
     }
     
     try:
-        if not os.path.exists(file_path):
+        if file_bytes is not None:
+            source = io.BytesIO(file_bytes)
+            file_size = len(file_bytes)
+        elif not os.path.exists(file_path):
             result["error"] = f"File not found: {file_path}"
             return result
+        else:
+            source = file_path
+            file_size = os.path.getsize(file_path)
             
         # Load the document
-        doc = Document(file_path)
+        doc = Document(source)
         
         # Extract text from paragraphs
         text_parts = []
@@ -75,7 +84,7 @@ def extract_docx_text(file_path: str) -> Dict[str, Any]:
             "version": core_props.version or "",
             "paragraph_count": len(doc.paragraphs),
             "table_count": len(doc.tables),
-            "file_size": os.path.getsize(file_path)
+            "file_size": file_size
         }
         
         result.update({
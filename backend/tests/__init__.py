@@ -0,0 +1,4 @@
+# Tests Package
+"""
+Regression tests for the backend analyzers
+"""
@@ -0,0 +1,52 @@
+"""
+Tests for batch readability scoring in FeedbackReportGenerator
+"""
+
+import unittest
+from unittest import mock
+
+from backend.analyzers import numeric_kernels
+from backend.analyzers.report_generator import FeedbackReportGenerator
+
+TEXTS = [
+    "Led a team of five engineers. Shipped the billing service! Was it on time? Yes.",
+    "",
+    "No terminator at all in this line",
+    "Built APIs... Reduced latency by 40%.\n- Mentored interns\n- Wrote docs",
+]
+
+
+class ScoreReadabilityBatchTest(unittest.TestCase):
+    """score_readability_batch matches the per-document Flesch helpers"""
+
+    def setUp(self):
+        self.generator = FeedbackReportGenerator()
+        self.parse_results = [{"text_extraction": {"text": text}} for text in TEXTS]
+
+    def expected(self):
+        expected = []
+        for text in TEXTS:
+            stats = self.generator._compute_text_stats(text)
+            expected.append({
+                "flesch_reading_ease": self.generator._calculate_flesch_score(stats),
+                "flesch_kincaid_grade": self.generator._calculate_flesch_kincaid_grade(stats)
+            })
+        return expected
+
+    def test_python_path_matches_per_document_scores(self):
+        with mock.patch.object(numeric_kernels, "NUMBA_AVAILABLE", False):
+            results = self.generator.score_readability_batch(self.parse_results)
+
+        self.assertEqual(results, self.expected())
+
+    @unittest.skipUnless(numeric_kernels.NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_path_matches_per_document_scores(self):
+        results = self.generator.score_readability_batch(self.parse_results)
+
+        for result, expected in zip(results, self.expected()):
+            self.assertAlmostEqual(result["flesch_reading_ease"], expected["flesch_reading_ease"])
+            self.assertAlmostEqual(result["flesch_kincaid_grade"], expected["flesch_kincaid_grade"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for batch resume analysis in the API module
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from backend.api.resume_analysis_api import DEMO_RESUME_PATH, analyze_resumes_batch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import backend.parsers.document_coordinator  # noqa: F401
+    PARSING_AVAILABLE = True
+except ImportError:  # e.g. PyPDF2 not installed
+    PARSING_AVAILABLE = False
+
+
+class AnalyzeResumesBatchTest(unittest.TestCase):
+    """analyze_resumes_batch returns one response per file, in input order"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.missing = os.path.join(self.temp_dir.name, "missing.pdf")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_missing_files_get_error_entries(self):
+        for max_workers in (1, 2):
+            results = analyze_resumes_batch([self.missing, "", self.missing], max_workers=max_workers)
+
+            self.assertEqual([result["status_code"] for result in results], [400, 400, 400])
+            self.assertEqual(results[0]["message"], "File not found or invalid file path")
+
+    @unittest.skipUnless(PARSING_AVAILABLE, "document parsing dependencies not installed")
+    def test_results_follow_input_order(self):
+        file_paths = [DEMO_RESUME_PATH, self.missing, DEMO_RESUME_PATH, self.missing]
+
+        for max_workers in (1, 2):
+            results = analyze_resumes_batch(file_paths, max_workers=max_workers, job_title="Software Engineer")
+
+            self.assertEqual([result["status_code"] for result in results], [200, 400, 200, 400])
+            self.assertEqual(results[0]["data"]["contact_info"], results[2]["data"]["contact_info"])
+
+    def test_batch_cli_prints_one_entry_per_manifest_line(self):
+        manifest = os.path.join(self.temp_dir.name, "manifest.txt")
+        with open(manifest, "w", encoding="utf-8") as f:
+            f.write(f"{self.missing}\n\n{self.missing}2\n")
+
+        completed = subprocess.run(
+            [sys.executable, "-m", "backend.api.resume_analysis_api", "--batch", manifest],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        )
+
+        results = json.loads(completed.stdout)
+        self.assertEqual([result["status_code"] for result in results], [400, 400])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests for ResumeQualityScorer result caching
+"""
+
+import unittest
+
+from backend.analyzers.resume_quality_scorer import ResumeQualityScorer
+from backend.parsers.data_extractor import InformationExtractor
+
+RESUME_TEXT = """Jane Doe
+jane.doe@example.com | (555) 123-4567
+
+Experience
+- Led a team of 5 engineers to cut deploy time by 40%
+- Built Python and React services for 10,000 users
+
+Education
+B.S. Computer Science, State University, 2018
+
+Skills
+Python, React, SQL, Docker
+"""
+
+
+class ScoreCacheTest(unittest.TestCase):
+    """Repeated scoring of the same resume is served from the score cache"""
+
+    def setUp(self):
+        self.scorer = ResumeQualityScorer()
+        self.extractor = InformationExtractor()
+
+    def test_identical_parse_results_hit_cache(self):
+        # Same as two parse_document calls: equal data, different extraction timestamps
+        first_data = self.extractor.extract_all_information(RESUME_TEXT, RESUME_TEXT)
+        second_data = self.extractor.extract_all_information(RESUME_TEXT, RESUME_TEXT)
+        second_data["extraction_metadata"] = dict(
+            second_data["extraction_metadata"], extraction_timestamp="2000-01-01T00:00:00"
+        )
+
+        first = self.scorer.score_resume_quality(RESUME_TEXT, first_data, ["Python", "AWS"], 3)
+        second = self.scorer.score_resume_quality(RESUME_TEXT, second_data, ["Python", "AWS"], 3)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.scorer._score_cache), 1)
+
+    def test_target_skills_with_blank_entries(self):
+        data = self.extractor.extract_all_information(RESUME_TEXT, RESUME_TEXT)
+
+        result = self.scorer.score_resume_quality(RESUME_TEXT, data, ["python", None, "", "AWS"])
+
+        skills_analysis = result["score_breakdown"]["content_fit"]["details"]["skills_analysis"]
+        self.assertEqual(skills_analysis["target_skills_count"], 2)
+
+
+
+class ScoreBatchTest(unittest.TestCase):
+    """score_batch returns the same results as scoring each resume on its own"""
+
+    def setUp(self):
+        self.scorer = ResumeQualityScorer()
+        data = InformationExtractor().extract_all_information(RESUME_TEXT, RESUME_TEXT)
+        texts = [RESUME_TEXT, "", "No bullets here. Just one plain sentence that is long enough."]
+        self.items = [{"extracted_text": text} for text in texts] + [
+            {"extracted_text": RESUME_TEXT + f"\n- Shipped {n} features for {n * 100} users",
+             "extracted_data": data, "target_skills": ["Python", "AWS"], "target_experience_years": n}
+            for n in range(1, 20)
+        ]
+
+    def expected(self, items):
+        return [ResumeQualityScorer().score_resume_quality(**item) for item in items]
+
+    def test_in_process_chunk(self):
+        items = self.items[:self.scorer.batch_chunk_size]
+
+        self.assertEqual(self.scorer.score_batch(items), self.expected(items))
+
+    def test_process_pool(self):
+        self.assertGreater(len(self.items), self.scorer.batch_chunk_size)
+
+        results = self.scorer.score_batch(self.items, max_workers=2)
+
+        self.assertEqual(results, self.expected(self.items))
+
+
+if __name__ == "__main__":
+    unittest.main()